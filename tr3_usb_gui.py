@@ -2,11 +2,12 @@
 #!/usr/bin/env python3
 """TR3 HF リーダ／ライタを Python から操作する GUI サンプル."""
 
+import functools
+import queue
 import threading
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Callable, List, Optional, Sequence
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import serial  # type: ignore
 import serial.tools.list_ports  # type: ignore
@@ -37,13 +38,16 @@ class SerialConnection:
         self.port_name = port_name
         self.baudrate = baudrate
         self._serial: Optional[serial.Serial] = None
+        self.reader: Optional["FrameReader"] = None
         self.last_error: str = ""
 
     def open(self) -> bool:
         """シリアルポートをオープンする。
 
         既存の接続があれば閉じ、新しい接続を確立する。
-        timeout=0でノンブロッキングモードに設定し、読み取り側でタイムアウトを制御する。
+        timeout=0.01 (10ms) の短いブロッキングタイムアウトを一度だけ設定し、
+        読み取り側ではカーネルのブロッキング read に任せる。
+        timeout 属性の再設定はOSへの設定変更呼び出しを伴うため行わない。
 
         Returns:
             bool: ポートのオープンに成功した場合はTrue、失敗した場合はFalse。
@@ -53,13 +57,17 @@ class SerialConnection:
             self._serial = serial.Serial(
                 port=self.port_name,
                 baudrate=self.baudrate,
-                timeout=0,  # ノンブロッキングモード
+                timeout=0.01,  # 短いブロッキングタイムアウト (10ms)
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
             )
             self._serial.reset_input_buffer()  # 入力バッファをクリア
             self._serial.reset_output_buffer() # 出力バッファをクリア
+            self._configure_low_latency()      # USBシリアルの遅延タイマ短縮（可能なら）
+            # 受信スレッドを起動（クローズまでポートを読み続ける）
+            self.reader = FrameReader(self)
+            self.reader.start()
             return True
         except serial.SerialException as exc:  # pyserial の例外を捕捉
             self.last_error = str(exc)
@@ -67,11 +75,30 @@ class SerialConnection:
             return False
 
     def close(self) -> None:
-        """シリアルポートを閉じる。"""
+        """シリアルポートを閉じる。受信スレッドも停止する。"""
+        if self.reader:
+            self.reader.stop()
+            self.reader.join(timeout=1.0)
+            self.reader = None
         if self._serial and self._serial.is_open:
             self._serial.close()
         self._serial = None
 
+    def _configure_low_latency(self) -> None:
+        """USBシリアル変換チップのレイテンシタイマを可能な範囲で短縮する。
+
+        FTDI等のUSBシリアルアダプタは既定で16ms程度のレイテンシタイマを持ち、
+        数十バイトのTR3フレームでも読み取りがその分遅延する。Linuxでは
+        pyserial の set_low_latency_mode() が ASYNC_LOW_LATENCY を設定する。
+        未対応の環境（Windowsではドライバ設定で変更する）では何もしない。
+        """
+        if not self._serial:
+            return
+        try:
+            self._serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, serial.SerialException):
+            pass  # 対応していない環境では既定値のまま動作する
+
     def write(self, data: Sequence[int]) -> bool:
         """バイナリデータをシリアルポートに送信する。
 
@@ -84,39 +111,43 @@ class SerialConnection:
         if not self._serial or not self._serial.is_open:
             self.last_error = "シリアルポートがオープンされていません。"
             return False
+        # bytes系はコピーせずそのまま渡す（送信フレームは定数bytesのことが多い）
+        payload = data if isinstance(data, (bytes, bytearray, memoryview)) else bytes(data)
         try:
-            written = self._serial.write(bytes(data))
-            return written == len(data)
+            written = self._serial.write(payload)
+            # 1フレーム=1回のwriteなので、ここでflushして1回のUSB転送にまとめる
+            self._serial.flush()
+            return written == len(payload)
         except serial.SerialException as exc:
             self.last_error = str(exc)
             return False
 
-    def read_byte(self, timeout_ms: int) -> Optional[int]:
-        """シリアルポートから1バイト読み取る（個別タイムアウト付き）。
+    def read_available(self) -> bytes:
+        """受信済みのデータをまとめて読み取る。
 
-        Args:
-            timeout_ms (int): 読み取りのタイムアウト時間（ミリ秒）。
+        先頭の1バイトはオープン時に設定したタイムアウト (10ms) まで待ち、
+        受信があれば続けてOSの受信バッファに溜まっている分を1回の read()
+        で読み出す。1バイトずつ読むよりシステムコール回数を大幅に削減できる。
+        timeout 属性はオープン時の設定を使い回すため、呼び出しごとの
+        再設定コスト（Windowsでは SetCommTimeouts 相当）が発生しない。
 
         Returns:
-            Optional[int]: 読み取ったバイトデータ (int)。タイムアウトまたはエラーの場合はNone。
+            bytes: 読み取ったバイト列。タイムアウトまたはエラーの場合は空のbytes。
         """
         if not self._serial or not self._serial.is_open:
             self.last_error = "シリアルポートがオープンされていません。"
-            return None
+            return b""
 
-        # timeout を一時的に設定（読み取り後、元の設定に戻す）
-        original_timeout = self._serial.timeout
-        self._serial.timeout = timeout_ms / 1000.0  # 秒単位に変換
         try:
-            chunk = self._serial.read(1)
-            if chunk:
-                return chunk[0]
-            return None
+            data = self._serial.read(1)
+            if data:
+                waiting = self._serial.in_waiting
+                if waiting:
+                    data += self._serial.read(waiting)
+            return data
         except serial.SerialException as exc:
             self.last_error = str(exc)
-            return None
-        finally:
-            self._serial.timeout = original_timeout  # タイムアウト設定を元に戻す
+            return b""
 
 
 # ===============================
@@ -143,17 +174,24 @@ CMD_BUZZER = 0x42   # ブザー制御コマンド
 HEADER_LEN = 4      # ヘッダーの長さ (STX, アドレス, コマンド, データ長)
 FOOTER_LEN = 3      # フッターの長さ (ETX, SUM, CR)
 
+# 応答の終端とみなすコマンド（ACK/NACK）
+_TERMINAL_CMDS = frozenset((CMD_ACK, CMD_NACK))
+
+# ACK応答の (コマンド, 詳細コマンド) をスライス比較1回で照合するための署名
+_ROM_ACK_SIG = bytes((CMD_ACK, DETAIL_ROM))
+_MODE_ACK_SIG = bytes((CMD_ACK, DETAIL_MODE_R))
+
 
 # ===============================
 # データ構造（C++版と対応）
 # ===============================
-@dataclass
+@dataclass(slots=True)
 class ReaderModeRaw:
     """リーダライタの動作モードの生バイトデータを保持するデータクラス。"""
-    bytes: List[int] = field(default_factory=list)
+    data: bytes = b""
 
 
-@dataclass
+@dataclass(slots=True)
 class ReaderModePretty:
     """リーダライタの動作モードを人間が読みやすい形式で保持するデータクラス。"""
     mode: str = ""             # 動作モード (例: コマンドモード)
@@ -164,14 +202,14 @@ class ReaderModePretty:
     baud: str = ""             # 通信速度 (例: 115200bps)
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """インベントリで読み取られた個々のタグ情報を保持するデータクラス。"""
-    uid: List[int] = field(default_factory=list) # タグのUID (バイト列のリスト)
+    uid: bytes = b""                             # タグのUID (MSBファースト)
     dsfid: int = 0                               # DSFID (Data Storage Format Identifier)
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryResult:
     """インベントリ操作の結果全体を保持するデータクラス。"""
     items: List[InventoryItem] = field(default_factory=list) # 読み取られたタグアイテムのリスト
@@ -182,37 +220,85 @@ class InventoryResult:
 # ===============================
 # ログ出力ヘルパー
 # ===============================
+# now_timestamp 用のキャッシュ。秒が変わらない間は strftime をやり直さない
+_last_sec = 0
+_last_prefix = ""
+
+
 def now_timestamp() -> str:
-    """現在のタイムスタンプを 'MM/DD HH:MM:SS.ms' 形式で返す。"""
-    dt = datetime.now()
-    return dt.strftime("%m/%d %H:%M:%S.%f")[:-3]
+    """現在のタイムスタンプを 'MM/DD HH:MM:SS.ms' 形式で返す。
+
+    ログ1行ごとに呼ばれるため、秒単位のプレフィックスをキャッシュして
+    ミリ秒部分だけを整形する（strftime は秒が変わったときのみ実行）。
+    """
+    global _last_sec, _last_prefix
+    t = time.time()
+    sec = int(t)
+    if sec != _last_sec:
+        _last_prefix = time.strftime("%m/%d %H:%M:%S", time.localtime(sec))
+        _last_sec = sec
+    return f"{_last_prefix}.{int((t - sec) * 1000):03d}"
 
 
 def to_hex_string(data: Sequence[int]) -> str:
-    """バイトデータのシーケンスを16進数文字列に変換して返す。"""
-    return " ".join(f"{b:02X}" for b in data)
+    """バイトデータのシーケンスを16進数文字列に変換して返す。
+
+    C実装の bytes.hex() を使うため、1バイトずつf-stringで整形するより高速。
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    return data.hex(" ").upper()
+
 
+_LOG_ENABLED = True  # False にすると、コールバック未指定時のログ出力を抑止する
 
-def log_line(tag: str, payload: str, callback: Optional[Callable[[str], None]] = None) -> None:
+
+def log_line(
+    tag: str,
+    payload: Union[str, Callable[[], str]],
+    callback: Optional[Callable[[str], None]] = None,
+) -> None:
     """指定されたタグとペイロードでログメッセージを生成し、表示する。
 
+    ログの出力先がない場合は何もせずに戻るため、ペイロードの整形コストを
+    払いたくないホットパスでは payload に文字列を返す callable を渡せる
+    （出力されるときだけ呼ばれる）。
+
     Args:
         tag (str): ログメッセージのタグ (例: "send", "recv", "cmt")。
-        payload (str): ログメッセージの本文。
+        payload (Union[str, Callable[[], str]]): ログメッセージの本文、またはそれを生成する関数。
         callback (Optional[Callable[[str], None]]): ログメッセージを処理するコールバック関数。
     """
+    if callback is None and not _LOG_ENABLED:
+        return
+    if callable(payload):
+        payload = payload()
     line = f"{now_timestamp()}  [{tag}]  {payload}"
     print(line)
     if callback:
         callback(line)
 
 
+def _log_bytes(tag: str, data: Sequence[int], callback: Optional[Callable[[str], None]] = None) -> None:
+    """送受信バイト列の16進ログを出力する。
+
+    出力先が無ければ to_hex_string による整形そのものをスキップするため、
+    ログ抑止時の送受信ホットパスに整形コストがかからない。
+    """
+    if callback is None and not _LOG_ENABLED:
+        return
+    log_line(tag, to_hex_string(data), callback)
+
+
 # ===============================
 # フレーム生成・検証
 # ===============================
 def calc_sum_until(data: Sequence[int], until: int) -> int:
     """指定されたインデックスまでのバイトデータの合計値の下位1バイトを計算する。
 
+    memoryview 経由でC実装の sum() に渡すため、リストのスライスコピーが
+    発生しない。bytes / bytearray を渡すのが最も高速。
+
     Args:
         data (Sequence[int]): バイトデータのシーケンス。
         until (int): 合計を計算する終端インデックス (このインデックスは含まれない)。
@@ -220,28 +306,30 @@ def calc_sum_until(data: Sequence[int], until: int) -> int:
     Returns:
         int: 計算されたSUM値 (下位1バイト)。
     """
-    return sum(data[:until]) & 0xFF
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
+    return sum(memoryview(data)[:until]) & 0xFF
 
 
-def make_frame(addr: int, cmd: int, payload: Sequence[int]) -> List[int]:
+def make_frame(addr: int, cmd: int, payload: Union[bytes, Sequence[int]]) -> bytes:
     """TR3プロトコルに基づいたコマンドフレームを生成する。
 
     Args:
         addr (int): アドレスバイト。
         cmd (int): コマンドバイト。
-        payload (Sequence[int]): データ部のペイロード。
+        payload (Union[bytes, Sequence[int]]): データ部のペイロード。
 
     Returns:
-        List[int]: 生成された完全なコマンドフレーム (バイトのリスト)。
+        bytes: 生成された完全なコマンドフレーム (バイト列)。
     """
     # ヘッダー部: STX, アドレス, コマンド, データ長
-    frame = [STX, addr & 0xFF, cmd & 0xFF, len(payload) & 0xFF]
-    frame.extend(payload) # ペイロードを追加
-    frame.append(ETX)     # ETXを追加
+    frame = bytearray((STX, addr & 0xFF, cmd & 0xFF, len(payload) & 0xFF))
+    frame += bytes(payload) # ペイロードを追加
+    frame.append(ETX)       # ETXを追加
     # SUM値を計算して追加 (STXからETXまで)
-    frame.append(calc_sum_until(frame, len(frame)) & 0xFF)
-    frame.append(CR)      # CRを追加
-    return frame
+    frame.append(sum(frame) & 0xFF)
+    frame.append(CR)        # CRを追加
+    return bytes(frame)
 
 
 def verify_frame(frame: Sequence[int]) -> bool:
@@ -253,24 +341,145 @@ def verify_frame(frame: Sequence[int]) -> bool:
     Returns:
         bool: フレームが有効な場合はTrue、そうでない場合はFalse。
     """
+    # SUM計算がC実装の高速パスを通るよう、bytes系に一度だけ変換する
+    if not isinstance(frame, (bytes, bytearray, memoryview)):
+        frame = bytes(frame)
+    mv = memoryview(frame)
+    n = len(mv)
+
     # フレームの最小長をチェック
-    if len(frame) < HEADER_LEN + FOOTER_LEN:
-        return False
-    
-    # データ長フィールドから期待されるフレーム長を計算
-    data_len = frame[3]
-    expected_len = HEADER_LEN + data_len + FOOTER_LEN
-    if len(frame) != expected_len:
+    if n < HEADER_LEN + FOOTER_LEN:
         return False
-    
-    # ETXとCRが正しい位置にあるかチェック
-    if frame[-1] != CR or frame[-3] != ETX:
+
+    # データ長フィールドから期待されるフレーム長と、ETX/CRの位置をチェック
+    if n != HEADER_LEN + mv[3] + FOOTER_LEN or mv[-1] != CR or mv[-3] != ETX:
         return False
-    
-    # SUM値を検証
-    sum_expect = frame[-2]
-    sum_calc = calc_sum_until(frame, len(frame) - 2) # STXからETXまでのSUMを計算
-    return sum_expect == sum_calc
+
+    # SUM値を検証 (STXからETXまで)
+    return (sum(mv[:-2]) & 0xFF) == mv[-2]
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_frame(addr: int, cmd: int, payload: bytes) -> bytes:
+    """定型コマンドのフレームをキャッシュ付きで生成する。
+
+    引数が同じ呼び出しではフレーム組み立てとSUM計算を省略できる。
+    payload はキャッシュキーになるため bytes で渡すこと。
+    """
+    return make_frame(addr, cmd, payload)
+
+
+# 定数のみで決まるコマンドフレームはモジュール読み込み時に一度だけ生成しておく
+FRAME_ROM_REQ = make_frame(ADDR_DEFAULT, CMD_ROM_REQ, [DETAIL_ROM])   # ROMバージョン要求
+FRAME_MODE_RD = make_frame(ADDR_DEFAULT, CMD_MODE_RD, [DETAIL_MODE_R]) # 動作モード読み取り
+FRAME_INV2 = make_frame(ADDR_DEFAULT, CMD_INV2, [DETAIL_INV2_F0, 0x40, 0x01]) # Inventory2 (UIDのみ)
+
+
+# ===============================
+# 受信スレッド（フレーム抽出）
+# ===============================
+def extract_frames(buf: bytearray, head: int) -> Tuple[List[bytes], int]:
+    """バッファ内の完成したフレームをすべて抽出する。
+
+    Args:
+        buf (bytearray): 受信バイトを蓄積しているバッファ。
+        head (int): buf 内の未処理データの先頭位置。
+
+    Returns:
+        Tuple[List[bytes], int]: 抽出した検証済みフレームのリストと、新しい先頭位置。
+    """
+    frames: List[bytes] = []
+    min_frame_len = HEADER_LEN + FOOTER_LEN
+    while True:
+        # STXの位置までカーソルを進める（C実装のfindで一括スキャン）
+        pos = buf.find(STX, head)
+        if pos < 0:
+            buf.clear()
+            head = 0
+            break
+        head = pos
+
+        # ヘッダーがまだ完全でない場合は次の受信を待つ
+        if len(buf) - head < HEADER_LEN:
+            break
+
+        # データ長フィールドから期待されるフレーム長を計算
+        need = min_frame_len + buf[head + 3]
+        if len(buf) - head < need:
+            break
+
+        frame = bytes(buf[head:head + need])
+        if not verify_frame(frame):
+            head += 1  # 無効なフレームの場合は1バイト進めて再同期
+            continue
+
+        frames.append(frame)
+        head += need
+    return frames, head
+
+
+class FrameReader(threading.Thread):
+    """シリアルポートを常時読み取り、検証済みフレームをキューへ積むスレッド。
+
+    受信とフレーム抽出をこのスレッドがまとめて行うため、コマンドを
+    発行する側は get() で完成フレームを受け取るだけでよい。
+    pyserial の read() 中はGILが解放されるので、GUIスレッドの動作を妨げない。
+    """
+
+    def __init__(self, sp: SerialConnection) -> None:
+        """FrameReaderのコンストラクタ。
+
+        Args:
+            sp (SerialConnection): 読み取り対象のシリアル接続。
+        """
+        super().__init__(daemon=True)
+        self._sp = sp
+        self._frames: "queue.SimpleQueue[bytes]" = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+        # 受信バッファは接続中ずっと使い回す。コマンド間で割り当てが発生せず、
+        # 前の応答の端数バイトも持ち越して次のフレーム抽出で処理できる。
+        self._rxbuf = bytearray()
+        self._rx_head = 0
+
+    def run(self) -> None:
+        """受信ループ本体。stop() が呼ばれるまでポートを読み続ける。"""
+        buf = self._rxbuf
+        head = self._rx_head
+        while not self._stop_event.is_set():
+            chunk = self._sp.read_available()
+            if not chunk:
+                serial_obj = self._sp._serial
+                if serial_obj is None or not serial_obj.is_open:
+                    break  # ポートが閉じられたら終了
+                continue
+            buf.extend(chunk)
+            frames, head = extract_frames(buf, head)
+            for frame in frames:
+                self._frames.put(frame)
+            # 消費済み領域が大きくなったらバッファを詰め直す
+            if head > 4096:
+                del buf[:head]
+                head = 0
+            self._rx_head = head
+
+    def get(self, timeout: float) -> Optional[bytes]:
+        """検証済みフレームを1つ取り出す。timeout 秒待っても無ければ None。"""
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def clear_pending(self) -> None:
+        """未取得のフレームをすべて破棄する（新しいコマンドの送信前に呼ぶ）。"""
+        while True:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                return
+
+    def stop(self) -> None:
+        """受信ループに停止を要求する。"""
+        self._stop_event.set()
 
 
 # ===============================
@@ -282,10 +491,10 @@ def communicate(
     timeout_ms: int,
     stop_on_ack: bool = True,
     logger: Optional[Callable[[str], None]] = None,
-) -> List[int]:
+) -> List[bytes]:
     """
     シリアルポートを介してコマンドを送信し、応答を受信する。
-    受信したバイト列から有効なフレームを抽出し、リストとして返す。
+    受信したバイト列から有効なフレームを抽出し、フレームごとのリストとして返す。
 
     Args:
         sp (SerialConnection): シリアル接続オブジェクト。
@@ -295,57 +504,41 @@ def communicate(
         logger (Optional[Callable[[str], None]]): ログ出力用のコールバック関数。
 
     Returns:
-        List[int]: 受信した有効なフレームのバイトリスト。タイムアウトやエラーの場合は空リスト。
+        List[bytes]: 受信した有効なフレーム (1エントリ=1フレーム)。タイムアウトやエラーの場合は空リスト。
     """
-    log_line("send", to_hex_string(command), logger)
-    if not sp.write(command):
-        log_line("cmt", f"送信エラー: {sp.last_error}", logger)
+    reader = sp.reader
+    if reader is None:
+        log_line("cmt", "受信スレッドが動作していません（ポート未接続）。", logger)
         return []
 
-    rxbuf: List[int] = [] # 受信バイトを一時的に保持するバッファ
-    out: List[int] = []   # 抽出された有効なフレームを格納するリスト
-    deadline = time.monotonic() + timeout_ms / 1000.0 # 処理の最終期限
+    # 前回コマンドの取り残しフレームを破棄してから送信する
+    reader.clear_pending()
 
-    while time.monotonic() < deadline:
-        byte = sp.read_byte(10) # 10msのタイムアウトで1バイト読み取り
-        if byte is not None:
-            rxbuf.append(byte)
-        else:
-            time.sleep(0.001) # 読み取れなかった場合は少し待機
-            continue
+    _log_bytes("send", command, logger)
+    if not sp.write(command):
+        log_line("cmt", f"送信エラー: {sp.last_error}", logger)
+        return []
 
-        # STXが見つかるまでバッファの先頭を読み飛ばす
-        while rxbuf and rxbuf[0] != STX:
-            del rxbuf[0]
-        
-        # ヘッダーがまだ完全でない場合は次のバイトを待つ
-        if len(rxbuf) < HEADER_LEN:
-            continue
+    out: List[bytes] = [] # 受信した有効なフレームを格納するリスト
+    _monotonic = time.monotonic
+    deadline = _monotonic() + timeout_ms / 1000.0 # 処理の最終期限
 
-        # データ長を取得し、期待されるフレーム長を計算
-        data_len = rxbuf[3]
-        need = HEADER_LEN + data_len + FOOTER_LEN
-        
-        # フレーム全体がバッファにない場合は次のバイトを待つ
-        if len(rxbuf) < need:
-            continue
+    while True:
+        remaining = deadline - _monotonic()
+        if remaining <= 0:
+            break
 
-        # フレームを抽出し、検証
-        frame = rxbuf[:need]
-        if not verify_frame(frame):
-            del rxbuf[0] # 無効なフレームの場合は先頭バイトを削除して再試行
+        frame = reader.get(min(remaining, 0.05))
+        if frame is None:
             continue
 
-        log_line("recv", to_hex_string(frame), logger)
-        out.extend(frame) # 有効なフレームを結果リストに追加
+        _log_bytes("recv", frame, logger)
+        out.append(frame) # 有効なフレームを結果リストに追加
 
-        cmd = frame[2]
         # ACKまたはNACKを受信し、かつstop_on_ackがTrueの場合は処理を終了
-        if stop_on_ack and cmd in (CMD_ACK, CMD_NACK):
+        if stop_on_ack and frame[2] in _TERMINAL_CMDS:
             return out
 
-        del rxbuf[:need] # 処理済みのフレームをバッファから削除
-
     log_line("cmt", "タイムアウト: レスポンスが一定時間内に受信されませんでした。", logger)
     return out
 
@@ -353,6 +546,10 @@ def communicate(
 # ===============================
 # ROM バージョン取得
 # ===============================
+# 表示可能なASCII文字 (0x20-0x7E) 以外を bytes.translate で除去するためのテーブル
+_NONPRINT = bytes(b for b in range(256) if not (0x20 <= b <= 0x7E))
+
+
 def read_rom_version(sp: SerialConnection, timeout_ms: int, logger: Optional[Callable[[str], None]] = None) -> str:
     """
     リーダライタのROMバージョンを読み取る。
@@ -366,33 +563,22 @@ def read_rom_version(sp: SerialConnection, timeout_ms: int, logger: Optional[Cal
         str: ROMバージョンの文字列。取得できなかった場合は空文字列。
     """
     log_line("cmt", "/* ROMバージョンの読み取り */", logger)
-    # ROMバージョン要求コマンドフレームを生成
-    tx = make_frame(ADDR_DEFAULT, CMD_ROM_REQ, [DETAIL_ROM])
     # コマンドを送信し、応答を受信 (ACK/NACKで停止)
-    rx = communicate(sp, tx, timeout_ms, True, logger)
+    rx = communicate(sp, FRAME_ROM_REQ, timeout_ms, True, logger)
     if not rx:
         return ""
 
-    # 受信したバイト列から最後の有効なフレームを抽出
-    index = 0
-    last_start = 0
-    while index + HEADER_LEN + FOOTER_LEN <= len(rx):
-        data_len = rx[index + 3]
-        need = HEADER_LEN + data_len + FOOTER_LEN
-        if index + need > len(rx):
-            break
-        last_start = index
-        index += need
-    frame = rx[last_start:index]
+    # 最後に受信したフレームを応答として扱う
+    frame = rx[-1]
 
     # フレームの検証と、コマンドがACKかつ詳細コマンドがROMバージョンであるかチェック
-    if not verify_frame(frame) or frame[2] != CMD_ACK or frame[4] != DETAIL_ROM:
+    if not verify_frame(frame) or frame[2:5:2] != _ROM_ACK_SIG:
         return ""
 
     # ROMバージョン情報をASCII文字列に変換
     # データ部の5バイト目からETXの直前までを抽出し、表示可能なASCII文字のみを対象とする
-    ascii_bytes = [b for b in frame[5:-3] if 0x20 <= b <= 0x7E]
-    ascii_str = bytes(ascii_bytes).decode("ascii", errors="ignore")
+    ascii_bytes = frame[5:-3].translate(None, delete=_NONPRINT)
+    ascii_str = ascii_bytes.decode("ascii", errors="ignore")
     pretty = ascii_str
     if len(ascii_str) >= 4:
         pretty = f"{ascii_str[0]}.{ascii_str[1:3]} {ascii_str[3:]}"
@@ -403,89 +589,86 @@ def read_rom_version(sp: SerialConnection, timeout_ms: int, logger: Optional[Cal
 # ===============================
 # NACK 解析
 # ===============================
+# NACKエラーコードとメッセージの対応（モジュール読み込み時に一度だけ構築）
+_NACK_MESSAGES = {
+    0x42: "SUM_ERROR: SUM不一致",
+    0x44: "FORMAT_ERROR: フォーマット/パラメータ不正",
+}
+
+
 def parse_nack_message(frame: Sequence[int]) -> str:
     if not verify_frame(frame) or frame[2] != CMD_NACK:
         return "Invalid NACK"
     code = frame[5] if len(frame) > HEADER_LEN + 1 else 0xFF
-    if code == 0x42:
-        return "SUM_ERROR: SUM不一致"
-    if code == 0x44:
-        return "FORMAT_ERROR: フォーマット/パラメータ不正"
-    return "Unknown NACK error"
+    return _NACK_MESSAGES.get(code, "Unknown NACK error")
 
 
 # ===============================
 # 動作モード関連
 # ===============================
+# モードバイト値と名称の対応。モジュール読み込み時に全256値分の
+# タプルへ展開しておき、実行時は添字アクセス1回で引けるようにする。
+_MODE_NAME_MAP = {
+    0x00: "コマンドモード",
+    0x01: "オートスキャンモード",
+    0x02: "トリガーモード",
+    0x03: "ポーリングモード",
+    0x24: "EASモード",
+    0x50: "連続インベントリモード",
+    0x58: "RDLOOPモード",
+    0x59: "RDLOOPモード(実行中)",
+    0x63: "EPCインベントリモード",
+    0x64: "EPCインベントリリードモード",
+}
+_MODE_NAMES = tuple(
+    _MODE_NAME_MAP.get(value, f"不明 (0x{value:02X})") for value in range(256)
+)
+
+# 通信速度設定 (spdbの上位2ビット) と表示名の対応
+_BAUD_NAMES = ("19200bps", "9600bps", "38400bps", "115200bps")
+
+# フラグバイトの各ビット値 (0/1) と表示名の対応
+_ANTICOLL_NAMES = ("無効", "有効")
+_READ_BEHAVIOR_NAMES = ("1回読み取り", "連続読み取り")
+_BUZZER_NAMES = ("鳴らさない", "鳴らす")
+_TX_DATA_NAMES = ("ユーザデータのみ", "ユーザデータ + UID")
+
+
 def pretty_from_raw(raw: ReaderModeRaw) -> ReaderModePretty:
     p = ReaderModePretty()
-    if len(raw.bytes) >= 4:
-        mode = raw.bytes[0]
-        flags = raw.bytes[2]
-        spdb = raw.bytes[3]
-
-        mode_map = {
-            0x00: "コマンドモード",
-            0x01: "オートスキャンモード",
-            0x02: "トリガーモード",
-            0x03: "ポーリングモード",
-            0x24: "EASモード",
-            0x50: "連続インベントリモード",
-            0x58: "RDLOOPモード",
-            0x59: "RDLOOPモード(実行中)",
-            0x63: "EPCインベントリモード",
-            0x64: "EPCインベントリリードモード",
-        }
-        p.mode = mode_map.get(mode, f"不明 (0x{mode:02X})")
-        p.anticollision = "有効" if flags & (1 << 2) else "無効"
-        p.read_behavior = "連続読み取り" if flags & (1 << 3) else "1回読み取り"
-        p.buzzer = "鳴らす" if flags & (1 << 4) else "鳴らさない"
-        p.tx_data = "ユーザデータ + UID" if flags & (1 << 5) else "ユーザデータのみ"
-
-        baud_map = {
-            0b00: "19200bps",
-            0b01: "9600bps",
-            0b10: "38400bps",
-            0b11: "115200bps",
-        }
-        p.baud = baud_map.get((spdb >> 6) & 0x03, "不明")
+    if len(raw.data) >= 4:
+        mode = raw.data[0]
+        flags = raw.data[2]
+        spdb = raw.data[3]
+
+        p.mode = _MODE_NAMES[mode]
+        p.anticollision = _ANTICOLL_NAMES[(flags >> 2) & 1]
+        p.read_behavior = _READ_BEHAVIOR_NAMES[(flags >> 3) & 1]
+        p.buzzer = _BUZZER_NAMES[(flags >> 4) & 1]
+        p.tx_data = _TX_DATA_NAMES[(flags >> 5) & 1]
+
+        p.baud = _BAUD_NAMES[(spdb >> 6) & 0x03]
     return p
 
 
 def read_reader_mode(
     sp: SerialConnection,
     raw: ReaderModeRaw,
-    pretty: ReaderModePretty,
     timeout_ms: int,
     logger: Optional[Callable[[str], None]] = None,
-) -> bool:
+) -> Optional[ReaderModePretty]:
+    """動作モードを読み取り、成功時は表示用の ReaderModePretty を返す。"""
     log_line("cmt", "/* リーダライタ動作モードの読み取り */", logger)
-    tx = make_frame(ADDR_DEFAULT, CMD_MODE_RD, [DETAIL_MODE_R])
-    rx = communicate(sp, tx, timeout_ms, True, logger)
+    rx = communicate(sp, FRAME_MODE_RD, timeout_ms, True, logger)
     if not rx:
-        return False
+        return None
 
-    index = 0
-    last_start = 0
-    while index + HEADER_LEN + FOOTER_LEN <= len(rx):
-        data_len = rx[index + 3]
-        need = HEADER_LEN + data_len + FOOTER_LEN
-        if index + need > len(rx):
-            break
-        last_start = index
-        index += need
-    frame = rx[last_start:index]
-    if not verify_frame(frame) or frame[2] != CMD_ACK or frame[4] != DETAIL_MODE_R:
-        return False
+    frame = rx[-1]
+    if not verify_frame(frame) or frame[2:5:2] != _MODE_ACK_SIG:
+        return None
 
-    raw.bytes = list(frame[5:-3])
-    pretty_result = pretty_from_raw(raw)
-    pretty.mode = pretty_result.mode
-    pretty.anticollision = pretty_result.anticollision
-    pretty.read_behavior = pretty_result.read_behavior
-    pretty.buzzer = pretty_result.buzzer
-    pretty.tx_data = pretty_result.tx_data
-    pretty.baud = pretty_result.baud
+    raw.data = frame[5:-3]
+    pretty = pretty_from_raw(raw)
 
     log_line("cmt", f"リーダライタ動作モード : {pretty.mode}", logger)
     log_line("cmt", f"アンチコリジョン       : {pretty.anticollision}", logger)
@@ -493,7 +676,7 @@ def read_reader_mode(
     log_line("cmt", f"ブザー                 : {pretty.buzzer}", logger)
     log_line("cmt", f"送信データ             : {pretty.tx_data}", logger)
     log_line("cmt", f"通信速度               : {pretty.baud}", logger)
-    return True
+    return pretty
 
 
 def write_reader_mode_to_command(
@@ -502,14 +685,14 @@ def write_reader_mode_to_command(
     timeout_ms: int,
     logger: Optional[Callable[[str], None]] = None,
 ) -> bool:
-    if len(current.bytes) < 4:
+    if len(current.data) < 4:
         log_line("cmt", "現行モード情報が不十分です（読み取りレスポンスのデータ部が短い）", logger)
         return False
 
-    flags = current.bytes[2]
+    flags = current.data[2]
     log_line("cmt", "/* コマンドモードへ設定します （他の設定は現状維持）*/", logger)
 
-    payload = [
+    payload = bytes((
         0x00,  # 詳細: RAM
         0x00,  # 新モード: コマンドモード
         0x00,  # 予約
@@ -517,23 +700,14 @@ def write_reader_mode_to_command(
         0x00,  # 予約
         0x00,  # ポーリング時間（上位）
         0x00,  # ポーリング時間（下位）
-    ]
+    ))
 
     tx = make_frame(ADDR_DEFAULT, CMD_MODE_WR, payload)
     rx = communicate(sp, tx, timeout_ms, True, logger)
     if not rx:
         return False
 
-    index = 0
-    last_start = 0
-    while index + HEADER_LEN + FOOTER_LEN <= len(rx):
-        data_len = rx[index + 3]
-        need = HEADER_LEN + data_len + FOOTER_LEN
-        if index + need > len(rx):
-            break
-        last_start = index
-        index += need
-    frame = rx[last_start:index]
+    frame = rx[-1]
     if not verify_frame(frame):
         return False
     if frame[2] == CMD_NACK:
@@ -545,6 +719,13 @@ def write_reader_mode_to_command(
 # ===============================
 # Inventory2
 # ===============================
+# 接続レベルの失敗を表すエラーメッセージ。リトライしても回復しないため、
+# 連続試行の呼び出し側はこれらを見たらループを中断する。
+_ERR_NO_READER = "受信スレッドが動作していません（ポート未接続）"
+_ERR_SEND = "送信エラー"
+_CONNECTION_ERRORS = frozenset((_ERR_NO_READER, _ERR_SEND))
+
+
 def run_inventory2(
     sp: SerialConnection,
     timeout_ms: int,
@@ -552,71 +733,80 @@ def run_inventory2(
 ) -> InventoryResult:
     result = InventoryResult()
     log_line("cmt", "/* Inventory2 */", logger)
-    tx = make_frame(ADDR_DEFAULT, CMD_INV2, [0xF0, 0x40, 0x01])
+    tx = FRAME_INV2
 
-    log_line("send", to_hex_string(tx), logger)
+    reader = sp.reader
+    if reader is None:
+        result.error_message = _ERR_NO_READER
+        return result
+
+    # 前回コマンドの取り残しフレームを破棄してから送信する
+    reader.clear_pending()
+
+    _log_bytes("send", tx, logger)
     if not sp.write(tx):
-        result.error_message = "送信エラー"
+        result.error_message = _ERR_SEND
         return result
 
-    buffer: List[int] = []
-    t_end = time.monotonic() + timeout_ms / 1000.0
-    t_quiet = time.monotonic()
+    # ホットループ内の属性参照・定数計算をローカルに束縛しておく
+    _monotonic = time.monotonic
+    min_ack_len = HEADER_LEN + FOOTER_LEN + 2  # ACK + UID数
+    min_uid_len = HEADER_LEN + FOOTER_LEN + 9  # DSFID + UID 8バイト
+
+    t_end = _monotonic() + timeout_ms / 1000.0
+    t_quiet = _monotonic()
     got_any_uid = False
     expected = -1
+    idx = 0  # 受信済みUID数（itemsを事前確保した場合の書き込み位置）
 
-    while time.monotonic() < t_end:
-        byte = sp.read_byte(10)
-        if byte is not None:
-            buffer.append(byte)
-            t_quiet = time.monotonic()
-        else:
-            time.sleep(0.001)
-            if got_any_uid and (time.monotonic() - t_quiet) > 0.12:
+    while _monotonic() < t_end:
+        frame = reader.get(0.01)
+        if frame is None:
+            if got_any_uid and (_monotonic() - t_quiet) > 0.12:
                 break
             continue
+        t_quiet = _monotonic()
 
-        while buffer and buffer[0] != STX:
-            del buffer[0]
-        if len(buffer) < HEADER_LEN:
-            continue
-
-        data_len = buffer[3]
-        need = HEADER_LEN + data_len + FOOTER_LEN
-        if len(buffer) < need:
-            continue
-
-        frame = buffer[:need]
-        if not verify_frame(frame):
-            del buffer[0]
-            continue
-
-        log_line("recv", to_hex_string(frame), logger)
+        _log_bytes("recv", frame, logger)
         cmd = frame[2]
 
         if cmd == CMD_ACK and frame[4] == DETAIL_INV2_F0:
-            if len(frame) >= HEADER_LEN + FOOTER_LEN + 2:
+            if len(frame) >= min_ack_len:
                 expected = frame[5]
                 result.expected_count = expected
                 log_line("cmt", f"UID数 : {expected}", logger)
-        elif cmd == RSP_UID and len(frame) >= HEADER_LEN + FOOTER_LEN + 9:
-            item = InventoryItem()
+                # UID数が確定したら、リストを一括確保して途中の再確保を避ける
+                if expected > idx:
+                    result.items.extend(InventoryItem() for _ in range(expected - idx))
+                # UID数が確定したら、残りの待ち時間をUID数に応じて短縮する
+                # （タグなしのときにタイムアウト満了まで待たない）
+                t_end = min(t_end, _monotonic() + 0.05 * max(1, expected))
+        elif cmd == RSP_UID and len(frame) >= min_uid_len:
+            if idx < len(result.items):
+                item = result.items[idx]
+            else:
+                item = InventoryItem()
+                result.items.append(item)
+            idx += 1
             item.dsfid = frame[4]
-            uid_lsb = frame[5:13]
-            item.uid = list(reversed(uid_lsb))
-            result.items.append(item)
+            # UIDはLSBファーストで届くため、Cレベルのスライスで逆順にする
+            item.uid = frame[5:13][::-1]
             got_any_uid = True
 
             log_line("cmt", f"DSFID : {item.dsfid:02X}", logger)
             log_line("cmt", f"UID   : {to_hex_string(item.uid)}", logger)
         elif cmd == CMD_NACK:
             result.error_message = parse_nack_message(frame)
+            # 事前確保した未受信分を返さないよう切り捨ててから抜ける
+            del result.items[idx:]
             return result
 
-        del buffer[:need]
-        if expected >= 0 and len(result.items) >= expected:
+        if expected >= 0 and idx >= expected:
             break
 
+    # タイムアウトなどで事前確保分が埋まらなかった場合は未受信分を切り捨てる
+    del result.items[idx:]
+
     if not result.items and not result.error_message:
         result.error_message = "UIDを取得できませんでした（タイムアウト/対象なし）"
     return result
@@ -635,22 +825,13 @@ def buzzer(
     tone = "ピー" if sound_type == 0x00 else "ピッピッピ" if sound_type == 0x01 else f"type=0x{sound_type:02X}"
     log_line("cmt", f"/* ブザー制御: {tone} */", logger)
 
-    payload = [response_type & 0xFF, sound_type & 0xFF]
-    tx = make_frame(ADDR_DEFAULT, CMD_BUZZER, payload)
+    # ブザーはインベントリのたびに同じ引数で鳴らされるためフレームをキャッシュする
+    tx = _cached_frame(ADDR_DEFAULT, CMD_BUZZER, bytes((response_type & 0xFF, sound_type & 0xFF)))
     rx = communicate(sp, tx, timeout_ms, True, logger)
     if not rx:
         return False
 
-    index = 0
-    last_start = 0
-    while index + HEADER_LEN + FOOTER_LEN <= len(rx):
-        data_len = rx[index + 3]
-        need = HEADER_LEN + data_len + FOOTER_LEN
-        if index + need > len(rx):
-            break
-        last_start = index
-        index += need
-    frame = rx[last_start:index]
+    frame = rx[-1]
     if not verify_frame(frame):
         return False
     if frame[2] == CMD_NACK:
@@ -659,9 +840,34 @@ def buzzer(
     return frame[2] == CMD_ACK
 
 
+def buzzer_no_wait(
+    sp: SerialConnection,
+    response_type: int,
+    sound_type: int,
+    logger: Optional[Callable[[str], None]] = None,
+) -> bool:
+    """ブザー制御コマンドを送信のみ行い、ACKを待たない。
+
+    連続インベントリの合間などACK待ちの往復を省きたい場合に使う。
+    残ったACKフレームは次のコマンド送信前に clear_pending() で破棄される。
+    """
+    tone = "ピー" if sound_type == 0x00 else "ピッピッピ" if sound_type == 0x01 else f"type=0x{sound_type:02X}"
+    log_line("cmt", f"/* ブザー制御（応答待ちなし）: {tone} */", logger)
+
+    tx = _cached_frame(ADDR_DEFAULT, CMD_BUZZER, bytes((response_type & 0xFF, sound_type & 0xFF)))
+    _log_bytes("send", tx, logger)
+    return sp.write(tx)
+
+
 # ===============================
 # GUI アプリケーション
 # ===============================
+# ログ表示の最大行数。超えたら古い行を削除して _LOG_TRIM_LINES 行まで戻す。
+# Textウィジェットを無制限に成長させると insert/see が徐々に重くなるため。
+_LOG_MAX_LINES = 5000
+_LOG_TRIM_LINES = 4500
+
+
 class Application(tk.Tk):
     """シンプルな GUI（Tkinter）で C++ サンプルの操作を再現."""
 
@@ -675,8 +881,19 @@ class Application(tk.Tk):
         self.reader_mode_pretty = ReaderModePretty()
         self._busy = False
 
+        # ワーカースレッドからのログはキューに積み、UIスレッドが定期的に反映する
+        self._log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self._log_lines = 0
+
+        # 通信ジョブは常駐ワーカースレッド1本で順番に実行する
+        # （操作のたびにスレッドを生成・破棄しない）
+        self._jobs: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
         self._build_widgets()
         self.refresh_ports()
+        self.after(50, self._drain_log_queue)
 
     # -------------------------------
     # UI 構築
@@ -721,6 +938,13 @@ class Application(tk.Tk):
         self.tries_entry = ttk.Entry(frame, textvariable=self.tries_var, width=10)
         self.tries_entry.grid(row=2, column=1, sticky=tk.W)
 
+        # インベントリ試行間隔（秒）。0なら待ち時間なしで連続実行する
+        interval_label = ttk.Label(frame, text="試行間隔[秒]")
+        interval_label.grid(row=2, column=2, sticky=tk.W, padx=(10, 0))
+        self.interval_var = tk.StringVar(value="0")
+        self.interval_entry = ttk.Entry(frame, textvariable=self.interval_var, width=10)
+        self.interval_entry.grid(row=2, column=3, sticky=tk.W)
+
         # 操作ボタン列
         buttons_frame = ttk.Frame(frame)
         buttons_frame.grid(row=3, column=0, columnspan=5, pady=(10, 5), sticky=tk.W)
@@ -760,11 +984,42 @@ class Application(tk.Tk):
     # ログ表示
     # -------------------------------
     def append_log(self, line: str) -> None:
+        """ログ行をTextウィジェットに追加する（UIスレッドからのみ呼ぶこと）。"""
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.insert(tk.END, line + "\n")
+        self._log_lines += 1
+        self._trim_log()
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
 
+    def _trim_log(self) -> None:
+        """ログが上限行数を超えたら古い行から削除する（リングバッファ相当）。"""
+        if self._log_lines > _LOG_MAX_LINES:
+            # delete("1.0", "N.0") は N-1 行目までを消すため、削除行数+1 を指定する
+            self.log_text.delete("1.0", f"{self._log_lines - _LOG_TRIM_LINES + 1}.0")
+            self._log_lines = _LOG_TRIM_LINES
+
+    def enqueue_log(self, line: str) -> None:
+        """ワーカースレッドから安全に呼べるログ出力。キュー経由でUIスレッドへ渡す。"""
+        self._log_queue.put(line)
+
+    def _drain_log_queue(self) -> None:
+        """キューに溜まったログ行をまとめて1回のinsertでTextへ反映する。"""
+        lines: List[str] = []
+        try:
+            while len(lines) < 500:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self._log_lines += len(lines)
+            self._trim_log()
+            self.log_text.see(tk.END)
+            self.log_text.configure(state=tk.DISABLED)
+        self.after(50, self._drain_log_queue)
+
     # -------------------------------
     # COM ポート一覧の更新
     # -------------------------------
@@ -828,15 +1083,21 @@ class Application(tk.Tk):
             messagebox.showinfo("実行中", "別の操作が完了するまでお待ちください。")
             return
         self._busy = True
+        self._jobs.put(func)
 
-        def task() -> None:
+    def _worker_loop(self) -> None:
+        """常駐ワーカースレッド本体。キューからジョブを取り出して順に実行する。"""
+        while True:
+            func = self._jobs.get()
             try:
                 func()
+            except Exception as exc:
+                # ジョブ中の例外（実行中の切断など）でワーカーを死なせない。
+                # ここでスレッドが終わると以降の操作が永久に「実行中」になる。
+                self.enqueue_log(f"*** エラー: {exc!r}")
             finally:
                 self.after(0, self._mark_idle)
 
-        threading.Thread(target=task, daemon=True).start()
-
     def _mark_idle(self) -> None:
         self._busy = False
 
@@ -848,7 +1109,7 @@ class Application(tk.Tk):
             return
 
         def job() -> None:
-            version = read_rom_version(self.connection, 600, self.append_log)
+            version = read_rom_version(self.connection, 600, self.enqueue_log)
             if not version:
                 self.after(0, lambda: messagebox.showwarning("ROM取得", "ROMバージョンの取得に失敗しました。"))
 
@@ -859,8 +1120,10 @@ class Application(tk.Tk):
             return
 
         def job() -> None:
-            success = read_reader_mode(self.connection, self.reader_mode_raw, self.reader_mode_pretty, 600, self.append_log)
-            if not success:
+            pretty = read_reader_mode(self.connection, self.reader_mode_raw, 600, self.enqueue_log)
+            if pretty:
+                self.reader_mode_pretty = pretty
+            else:
                 self.after(0, lambda: messagebox.showwarning("動作モード", "動作モードの取得に失敗しました。"))
 
         self.run_async(job)
@@ -870,10 +1133,13 @@ class Application(tk.Tk):
             return
 
         def job() -> None:
-            success = write_reader_mode_to_command(self.connection, self.reader_mode_raw, 600, self.append_log)
+            success = write_reader_mode_to_command(self.connection, self.reader_mode_raw, 600, self.enqueue_log)
             if success:
-                # 再度読み取り、結果を更新する
-                read_reader_mode(self.connection, self.reader_mode_raw, self.reader_mode_pretty, 600, self.append_log)
+                # 書き込み後の状態は既知（モード=コマンド、他の設定は維持）
+                # なので、確認のための再読み取りは行わず手元で更新する
+                self.reader_mode_raw.data = b"\x00" + self.reader_mode_raw.data[1:]
+                self.reader_mode_pretty = pretty_from_raw(self.reader_mode_raw)
+                self.enqueue_log(f"リーダライタ動作モード : {self.reader_mode_pretty.mode}")
             else:
                 self.after(0, lambda: messagebox.showwarning("コマンドモード", "モード設定に失敗しました。"))
 
@@ -888,25 +1154,43 @@ class Application(tk.Tk):
             messagebox.showwarning("Inventory2", "試行回数には 1 以上の整数を入力してください。")
             return
         tries = max(1, min(tries, 1000000))
+        try:
+            interval_s = float(self.interval_var.get())
+        except ValueError:
+            messagebox.showwarning("Inventory2", "試行間隔には 0 以上の数値を入力してください。")
+            return
+        interval_s = max(0.0, interval_s)
 
         def job() -> None:
             for index in range(1, tries + 1):
+                cycle_start = time.perf_counter()
                 if tries > 1:
-                    self.append_log(f"--- インベントリ試行 {index} / {tries} ---")
-                result = run_inventory2(self.connection, 2000, self.append_log)
+                    self.enqueue_log(f"--- インベントリ試行 {index} / {tries} ---")
+                result = run_inventory2(self.connection, 2000, self.enqueue_log)
                 if result.error_message:
-                    self.append_log(f"NACK/エラー: {result.error_message}")
-                    buzzer(self.connection, 0x01, 0x01, 600, self.append_log)
+                    self.enqueue_log(f"NACK/エラー: {result.error_message}")
+                    if result.error_message in _CONNECTION_ERRORS:
+                        # 送信不能・未接続は待ち時間を消費せず即失敗するため、
+                        # interval=0 のまま回し続けるとログが溢れる。中断する。
+                        self.enqueue_log("接続エラーのため試行を中断します")
+                        break
+                    sound_type = 0x01
                 else:
-                    self.append_log(f"取得UID数: {len(result.items)}")
+                    self.enqueue_log(f"取得UID数: {len(result.items)}")
                     for i, item in enumerate(result.items):
-                        self.append_log(f"  [{i}] {to_hex_string(item.uid)}")
-                    if result.items:
-                        buzzer(self.connection, 0x01, 0x00, 600, self.append_log)
-                    else:
-                        buzzer(self.connection, 0x01, 0x01, 600, self.append_log)
+                        self.enqueue_log(f"  [{i}] {to_hex_string(item.uid)}")
+                    sound_type = 0x00 if result.items else 0x01
                 if index < tries:
-                    time.sleep(0.1)
+                    # 続けて次の試行に入るため、ブザーのACKは待たない
+                    # （ACKは次の送信前の clear_pending() で破棄される）
+                    buzzer_no_wait(self.connection, 0x01, sound_type, self.enqueue_log)
+                else:
+                    buzzer(self.connection, 0x01, sound_type, 600, self.enqueue_log)
+                if index < tries and interval_s > 0.0:
+                    # 試行の所要時間を差し引いてレートを一定に保つ（固定スリープにしない）
+                    remaining = interval_s - (time.perf_counter() - cycle_start)
+                    if remaining > 0:
+                        time.sleep(remaining)
 
         self.run_async(job)
 
@@ -915,7 +1199,7 @@ class Application(tk.Tk):
             return
 
         def job() -> None:
-            success = buzzer(self.connection, 0x01, sound_type, 600, self.append_log)
+            success = buzzer(self.connection, 0x01, sound_type, 600, self.enqueue_log)
             if not success:
                 self.after(0, lambda: messagebox.showwarning("ブザー", "ブザー制御に失敗しました。"))
 